@@ -30,6 +30,8 @@ The 'count_outcomes' function also allows you to run instances of the model
 where certain outcomes are guaranteed. for instance you could run the model 
 with the stipulation that Baylor University makes the final 4 to see how that
 outcome would change the spread of results. 
+For repeated runs like these 'load_inputs' reads the CSVs once and 
+'run_simulation' runs the model on the already loaded inputs. 
 
 The function 'results to csv' will write the results to a csv file for easy 
 import into an excel document to be shared with participants. 
@@ -40,241 +42,245 @@ This module relies on several CSVs to run properly:
     a CSV containing the current points of each participant for rounds 1 and 2
     a CSV containing the schedule of each team should they advance to the next
     round - useful in determining resultant matchups in each subsequent round. 
+
+Rather than looping over iterations one at a time, iterations are simulated
+in batches with NumPy: each round is resolved for a whole batch in a single 
+vectorized comparison and the points of every player are tallied as one 
+iterations by players array. 
 """
 
 import csv
-import random
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from itertools import repeat
+from multiprocessing import Pool, cpu_count
+
+import numpy as np
+
+# Pick sheet names and point values of each round from the Elite 8 onwards
+STAGES = ["Elite 8", "Final 4", "Championship", "Champion"]
+STAGE_POINTS = [40, 80, 160, 320]
+# Game numbers played in each of those rounds
+ROUND_GAMES = [np.arange(1, 9), np.arange(9, 13), np.arange(13, 15), np.arange(15, 16)]
+# Iterations simulated at once, bounding memory use on long runs
+BATCH_SIZE = 100000
 
 
-def get_formatted_picks(filename):
-    """Gets a formatted dictionary of each players picks"""
-    picks, stage_dict, teams = {}, {}, []
-    name, stage, last_stage, last_name = "", "", "", ""
+def get_formatted_picks(filename, team_id):
+    """Gets the players and a player by team by round array flagging each player's picks"""
+    picks = defaultdict(lambda: defaultdict(list))
     with open(filename) as picks_csv:
         reader = csv.reader(picks_csv)
         header_row = next(reader)
-        for row in reader:
-            # print(row)
-            name = row[0]
-            stage = row[1]
-            team = row[2]
-            if name != last_name and last_name != "":
-                picks[last_name] = stage_dict
-                stage_dict = {}
-                teams = []
-                teams.append(team)
-            else:
-                if stage != last_stage and last_stage != "":
-                    stage_dict[last_stage] = teams
-                    teams = []
-                    teams.append(team)
-                    if stage == "Champion":
-                        stage_dict[stage] = [team]
-                else:
-                    teams.append(team)
-            last_name = name
-            last_stage = stage
-        return picks
-
-
-def get_pcts(filename):
-    """Gets a formatted list of chances for each team in each round"""
+        for name, stage, team, *_ in reader:
+            # Skips the "End" row closing the sheet and any other non-pick rows
+            if stage in STAGES:
+                picks[name][stage].append(team)
+    players = list(picks)
+    pick_matrix = np.zeros((len(players), len(team_id), 4), dtype=bool)
+    for player, dicts in enumerate(picks.values()):
+        for stage, stage_name in enumerate(STAGES):
+            for team in dicts[stage_name]:
+                # Picked teams already out of the tournament can never score
+                if team in team_id:
+                    pick_matrix[player, team_id[team], stage] = True
+    return players, pick_matrix
+
+
+def get_pcts(filename, team_id):
+    """Gets the ratings of the teams still in the tournament in the order of team_id"""
     pct_dict = {}
     with open(filename) as pcts_csv:
         reader = csv.reader(pcts_csv)
         header_row = next(reader)
-        team = ""
-        pct1, pct2, pct3, pct4 = float(0), float(0), float(0), float(0)
         for row in reader:
-            team = row[0]
-            pct1 = float(row[1])
-            pct2 = float(row[2])
-            pct3 = float(row[3])
-            pct4 = float(row[4])
-            rating = float(row[5])
-            pcts = [pct1, pct2, pct3, pct4, rating]
-            pct_dict[team] = pcts
-    return pct_dict
-
-
-def get_teams_list(pct_dict):
-    """Gets a list of all teams still in the tournament"""
-    teams = []
-    for team, lists in pct_dict.items():
-        teams.append(team)
-    return teams
+            pct_dict[row[0]] = float(row[5])
+    missing = [team for team in team_id if team not in pct_dict]
+    if missing:
+        raise ValueError("No rating found for " + ", ".join(missing))
+    # Rated teams without a schedule are already out of the tournament
+    return np.array([pct_dict[team] for team in team_id])
 
 
 def get_schedules(filename):
-    """Gets a dictionary with everyone's possible games as value lists"""
+    """Gets the teams still in the tournament, their indexes and a team by round array of games"""
+    teams, schedules = [], []
     with open(filename) as schedules_csv:
         reader = csv.reader(schedules_csv)
         header_row = next(reader)
-        schedules = {}
         for row in reader:
-            team = row[0]
-            games = []
-            games.append(int(row[1]))
-            games.append(int(row[2]))
-            games.append(int(row[3]))
-            games.append(float(row[4]))
-            schedules[team] = games
-    return schedules
-
-
-def get_modeled_round(
-    stage, current_teams, schedules, pcts, probability="scaled", final_4=[]
-):
-    """Gets a list of teams for a given round based on a list of teams in the previous round"""
-
-    if stage == "elite eight":
-        game1 = 1
-        game2 = 8
-    if stage == "final four":
-        game1 = 9
-        game2 = 12
-    if stage == "championship":
-        game1 = 13
-        game2 = 14
-    if stage == "champion":
-        game1 = 15
-        game2 = 15
-    game_nums = [i for i in range(game1, game2 + 1)]
-    games_dict = {}
-    for i in game_nums:
-        teams_in_game = []
-        for team, games in schedules.items():
-            if i in games and team in current_teams:
-                teams_in_game.append(team)
-        games_dict[i] = teams_in_game
-    # print(games_dict)
-    next_round = []
-    for game, teams in games_dict.items():
-        flag = 0
-        team1_rating = pcts[teams[0]][4]
-        team2_rating = pcts[teams[1]][4]
-        team1_pct = int(
-            10000 / (1 + 10 ** (-(team1_rating - team2_rating) * (30.464 / 400)))
-        )
-        team2_pct = int(
-            10000 / (1 + 10 ** (-(team2_rating - team1_rating) * (30.464 / 400)))
-        )
-
-        outcome = random.randint(1, 10000)
-        highest_pct = 0
-        high_team = 0
-        low_team = 0
-        if team1_pct > team2_pct:
-            highest_pct = team1_pct
-            high_team = 0
-            low_team = 1
+            teams.append(row[0])
+            schedules.append([int(game) for game in row[1:5]])
+    # Points are scored with one bit per team in a 64 bit integer
+    if len(teams) > 64:
+        raise ValueError("The model can only track up to 64 teams")
+    team_id = {team: i for i, team in enumerate(teams)}
+    return teams, team_id, np.array(schedules, dtype=np.intp)
+
+
+def get_matchups(schedules):
+    """Gets the two entrants of every game indexed by game number
+
+    Sweet 16 games (1-8) list the indexes of the two teams playing while later
+    games list the numbers of the two games whose winners meet in them.
+    """
+    matchups = np.zeros((16, 2), dtype=np.intp)
+    entrants = {}
+    for team, games in enumerate(schedules.tolist()):
+        slots = [team] + games[:-1]
+        for game, slot in zip(games, slots):
+            if slot not in entrants.setdefault(game, []):
+                entrants[game].append(slot)
+    for game, slots in entrants.items():
+        matchups[game] = slots
+    return matchups
+
+
+def get_win_probs(ratings, probability="scaled"):
+    """Gets the chance of the row team beating the column team for every pair of teams"""
+    if probability == "even":
+        return np.full((len(ratings), len(ratings)), 0.5)
+    rating_diffs = ratings[:, np.newaxis] - ratings[np.newaxis, :]
+    return 1 / (1 + 10 ** (-rating_diffs * (30.464 / 400)))
+
+
+def simulate_bracket(outcomes, matchups, win_probs, forced):
+    """Gets the winning team of every game for every iteration indexed by game number"""
+    iterations = len(outcomes)
+    winners = np.zeros((iterations, 16), dtype=np.intp)
+    for stage, games in enumerate(ROUND_GAMES):
+        if stage == 0:
+            # Sweet 16 matchups are fixed so their odds are one value per game
+            team1 = matchups[games, 0]
+            team2 = matchups[games, 1]
         else:
-            highest_pct = team2_pct
-            high_team = 1
-            low_team = 0
-        for team in teams:
-            if team in final_4:
-                next_round.append(team)
-                flag = 0
-                break
-            else:
-                flag = 1
-        if flag == 1:
-            if outcome < highest_pct and probability == "scaled":
-                next_round.append(teams[high_team])
-            elif probability == "scaled":
-                next_round.append(teams[low_team])
-            if outcome < 5000 and probability == "even":
-                next_round.append(teams[high_team])
-            elif probability == "even":
-                next_round.append(teams[low_team])
-    return next_round
-
-
-def get_current_points(filename):
-    """Get the current points of a player returned as a dictionary"""
+            team1 = winners[:, matchups[games, 0]]
+            team2 = winners[:, matchups[games, 1]]
+        team1_pct = win_probs[team1, team2]
+        next_round = np.where(outcomes[:, games - 1] < team1_pct, team1, team2)
+        if forced[stage].any():
+            next_round = np.where(
+                forced[stage][team1],
+                team1,
+                np.where(forced[stage][team2], team2, next_round),
+            )
+        winners[:, games] = next_round
+    return winners
+
+
+def get_current_points(filename, players):
+    """Get the current points of every player in the order of players"""
     current_points = {}
     with open(filename) as current_points_csv:
         reader = csv.reader(current_points_csv)
         header_row = next(reader)
         for row in reader:
             current_points[row[0]] = int(row[1])
-    return current_points
-
-
-def get_points(elite_eight, final_four, championship, champion, picks, filename):
-    """Get the total points for a player based on a single iteration"""
-    current_points_dict = get_current_points(filename)
-    points_dict = {}
-    for player, dicts in picks.items():
-        points = 0
-        current_points = current_points_dict[player]
-        eight_count = 0
-        for team in elite_eight:
-            if team in dicts["Elite 8"]:
-                eight_count += 1
-        four_count = 0
-        for team in final_four:
-            if team in dicts["Final 4"]:
-                four_count += 1
-        championship_count = 0
-        for team in championship:
-            if team in dicts["Championship"]:
-                championship_count += 1
-        champion_count = 0
-        for team in champion:
-            if team in dicts["Champion"]:
-                champion_count += 1
-        points = (
-            (40 * eight_count)
-            + (80 * four_count)
-            + (160 * championship_count)
-            + (320 * champion_count)
-            + current_points
+    return np.array([current_points[player] for player in players])
+
+
+def get_points(rounds, pick_mask, current_points):
+    """Get the total points for every player in every iteration"""
+    # Each team is one bit so a round's picks and winners fit a single integer
+    team_bits = np.uint64(1) << np.arange(pick_mask.shape[1], dtype=np.uint64)
+    pick_bits = (pick_mask * team_bits[:, np.newaxis]).sum(axis=1, dtype=np.uint64)
+    points = np.tile(current_points, (len(rounds[0]), 1))
+    for stage, round_winners in enumerate(rounds):
+        round_bits = np.bitwise_or.reduce(team_bits[round_winners], axis=1)
+        hits = np.bitwise_count(round_bits[:, np.newaxis] & pick_bits[:, stage])
+        points += STAGE_POINTS[stage] * hits.astype(points.dtype)
+    return points
+
+
+def get_winner_and_loser(points):
+    """Gets the index of the winner and loser for every iteration, a tie being len(players)"""
+    tie = points.shape[1]
+    winner = points.argmax(axis=1)
+    loser = points.argmin(axis=1)
+    if tie > 1:
+        # Only the two lowest and two highest scores of each row need to be in place
+        ends = np.partition(points, sorted({0, 1, tie - 2, tie - 1}), axis=1)
+        winner = np.where(ends[:, -1] == ends[:, -2], tie, winner)
+        loser = np.where(ends[:, 0] == ends[:, 1], tie, loser)
+    return winner, loser
+
+
+def simulate_all(
+    rng,
+    iterations,
+    matchups,
+    win_probs,
+    pick_mask,
+    current_points,
+    forced,
+):
+    """Simulates a batch of iterations returning the round winners, points, winner and loser of each"""
+    outcomes = rng.random((iterations, 15))
+    winners = simulate_bracket(outcomes, matchups, win_probs, forced)
+    rounds = [winners[:, games] for games in ROUND_GAMES]
+    points = get_points(rounds, pick_mask, current_points)
+    winner, loser = get_winner_and_loser(points)
+    return rounds, points, winner, loser
+
+
+def run_chunk(seed, iterations, inputs):
+    """Runs a chunk of iterations returning its counts and the brackets win_check wins"""
+    (
+        players,
+        teams_list,
+        matchups,
+        win_probs,
+        pick_mask,
+        current_points,
+        forced,
+        win_check,
+        examples,
+        advanced,
+    ) = inputs
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(len(players), dtype=np.int64)
+    losses = np.zeros(len(players), dtype=np.int64)
+    round_counts = np.zeros((len(teams_list), 4), dtype=np.int64)
+    brackets = []
+    for start in range(0, iterations, BATCH_SIZE):
+        rounds, points, winner, loser = simulate_all(
+            rng,
+            min(BATCH_SIZE, iterations - start),
+            matchups,
+            win_probs,
+            pick_mask,
+            current_points,
+            forced,
         )
-        points_dict[player] = points
-    # print(points_dict)
-    return points_dict
-
-
-def get_winner(points_dict):
-    """Gets the winner for an iteration"""
-    high_score = 0
-    winner = ""
-    for player, score in points_dict.items():
-        if score > high_score:
-            winner = player
-            high_score = score
-        elif score == high_score:
-            winner = "tie"
-    # print(winner)
-    return winner
-
-
-def get_loser(points_dict):
-    """Gets the winner for an iteration"""
-    low_score = 10000
-    loser = ""
-    for player, score in points_dict.items():
-        if score < low_score:
-            loser = player
-            low_score = score
-        elif score == low_score:
-            loser = "tie"
-    # print(winner)
-    return loser
+        wins += np.bincount(winner, minlength=len(players))
+        losses += np.bincount(loser, minlength=len(players))
+        if win_check in players:
+            checked = winner == players.index(win_check)
+            if examples == True:
+                for i in np.flatnonzero(checked):
+                    bracket = [
+                        [teams_list[t] for t in round_winners[i]]
+                        for round_winners in rounds
+                    ]
+                    brackets.append(
+                        (bracket, dict(zip(players, points[i].tolist())))
+                    )
+            if advanced == True:
+                for stage, round_winners in enumerate(rounds):
+                    round_counts[:, stage] += np.bincount(
+                        round_winners[checked].ravel(), minlength=len(teams_list)
+                    )
+    win_count = Counter(dict(zip(players, wins.tolist())))
+    loss_count = Counter(dict(zip(players, losses.tolist())))
+    return win_count, loss_count, round_counts, brackets
 
 
 def format_automatic_inclusion_lists(elite_8, final_4, champ_game, champ):
-    for team in champ:
-        if team not in champ_game:
-            champ_game.append(team)
-    for team in champ_game:
-        if team not in final_4:
-            final_4.append(team)
-    for team in final_4:
-        if team not in elite_8:
-            elite_8.append(team)
+    """Gets sets of the teams guaranteed each round, adding them to every earlier round"""
+    champ = frozenset(champ)
+    champ_game = frozenset(champ_game) | champ
+    final_4 = frozenset(final_4) | champ_game
+    elite_8 = frozenset(elite_8) | final_4
     if len(champ_game) > 2 or len(final_4) > 4 or len(elite_8) > 8:
         print("Too many teams in a round. Fix error and run again.")
     else:
@@ -291,6 +297,28 @@ def get_win_loss_pcts(win_count, loss_count, iterations):
     return win_pcts, loss_pcts
 
 
+@dataclass(frozen=True)
+class Inputs:
+    """The tournament and bracket pool information, indexed by team and player"""
+
+    teams_list: list
+    players: list
+    ratings: np.ndarray
+    matchups: np.ndarray
+    pick_mask: np.ndarray
+    current_points: np.ndarray
+
+
+def load_inputs(schedules_file, current_points_file, probabilities_file, picks_file):
+    """Brings in the tournament and player bracket information from the CSVs"""
+    teams_list, team_id, schedules = get_schedules(schedules_file)
+    ratings = get_pcts(probabilities_file, team_id)
+    players, pick_mask = get_formatted_picks(picks_file, team_id)
+    matchups = get_matchups(schedules)
+    current_points = get_current_points(current_points_file, players)
+    return Inputs(teams_list, players, ratings, matchups, pick_mask, current_points)
+
+
 def count_outcomes(
     iterations,
     schedules_file,
@@ -301,87 +329,120 @@ def count_outcomes(
     examples=False,
     advanced=False,
     probability="scaled",
-    elite_8=[],
-    final_4=[],
-    champ_game=[],
-    champ=[],
+    elite_8=None,
+    final_4=None,
+    champ_game=None,
+    champ=None,
+    processes=1,
+    seed=None,
 ):
-    """Counts the winners for a set of iterations"""
+    """Counts the winners for a set of iterations
+
+    Setting processes to more than 1 splits the iterations across that many
+    worker processes, or every core when it is None. Scripts doing so need an
+    if __name__ == "__main__" guard. A seed makes the run repeatable.
+    """
+    inputs = load_inputs(
+        schedules_file, current_points_file, probabilities_file, picks_file
+    )
+    return run_simulation(
+        inputs,
+        iterations,
+        win_check,
+        examples,
+        advanced,
+        probability,
+        elite_8,
+        final_4,
+        champ_game,
+        champ,
+        processes,
+        seed,
+    )
+
 
-    # Bring in initial tournament and player bracket information
-    pcts = get_pcts(probabilities_file)
-    picks = get_formatted_picks(picks_file)
-    schedules = get_schedules(schedules_file)
+def run_simulation(
+    inputs,
+    iterations,
+    win_check="",
+    examples=False,
+    advanced=False,
+    probability="scaled",
+    elite_8=None,
+    final_4=None,
+    champ_game=None,
+    champ=None,
+    processes=1,
+    seed=None,
+):
+    """Counts the winners for a set of iterations using inputs from load_inputs"""
+    if processes is None:
+        processes = cpu_count()
+    teams_list, players = inputs.teams_list, inputs.players
 
     # Establish the win and loss count dictionaries which will track each winner in the model
-    win_count = {}
-    loss_count = {}
-    for name, pick_list in picks.items():
-        win_count[name] = 0
-    win_count["tie"] = 0
-    for name, pick_list in picks.items():
-        loss_count[name] = 0
-    loss_count["tie"] = 0
+    win_count = Counter({name: 0 for name in players + ["tie"]})
+    loss_count = Counter({name: 0 for name in players + ["tie"]})
 
     # Establish the dictionary counting the number of times a team is in each round per all iterations
-    teams_round_counts = {}
-    teams_list = []
-    for team, games in schedules.items():
-        teams_round_counts[team] = [0, 0, 0, 0]
-        teams_list.append(team)
-    elite_8, final4, champ_game, champ = format_automatic_inclusion_lists(
-        elite_8, final_4, champ_game, champ
+    teams_round_counts = {team: np.zeros(4, dtype=np.int64) for team in teams_list}
+    elite_8, final_4, champ_game, champ = format_automatic_inclusion_lists(
+        elite_8 or [], final_4 or [], champ_game or [], champ or []
     )
 
-    for i in range(0, iterations):
-        elite_eight = get_modeled_round(
-            "elite eight", teams_list, schedules, pcts, probability, elite_8
-        )
-        final_four = get_modeled_round(
-            "final four", elite_eight, schedules, pcts, probability, final_4
-        )
-        championship = get_modeled_round(
-            "championship", final_four, schedules, pcts, probability, champ_game
-        )
-        champion = get_modeled_round(
-            "champion", championship, schedules, pcts, probability, champ
-        )
-        points_dict = get_points(
-            elite_eight, final_four, championship, champion, picks, current_points_file
-        )
-        winner = get_winner(points_dict)
-        win_count[winner] += 1
-        loser = get_loser(points_dict)
-        loss_count[loser] += 1
-
-        if win_check == winner and examples == True:
-            print("Winner: " + winner)
-            print("Elite 8: " + str(elite_eight))
-            print("Final 4: " + str(final_four))
-            print("Championship: " + str(championship))
-            print("Champion: " + str(champion))
+    # Derive the matchup odds and guaranteed outcomes indexed by team
+    win_probs = get_win_probs(inputs.ratings, probability)
+    forced = [
+        np.array([team in teams for team in teams_list])
+        for teams in (elite_8, final_4, champ_game, champ)
+    ]
+
+    # Split the iterations into one chunk per process, each with its own random stream
+    chunks = [
+        iterations // processes + (1 if i < iterations % processes else 0)
+        for i in range(processes)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(processes)
+    chunk_inputs = (
+        players + ["tie"],
+        teams_list,
+        inputs.matchups,
+        win_probs,
+        inputs.pick_mask,
+        inputs.current_points,
+        forced,
+        win_check,
+        examples,
+        advanced,
+    )
+    if processes == 1:
+        results = [run_chunk(seeds[0], iterations, chunk_inputs)]
+    else:
+        with Pool(processes) as pool:
+            results = pool.starmap(
+                run_chunk, zip(seeds, chunks, repeat(chunk_inputs))
+            )
+
+    for chunk_wins, chunk_losses, chunk_round_counts, brackets in results:
+        win_count.update(chunk_wins)
+        loss_count.update(chunk_losses)
+        for team, counts in zip(teams_list, chunk_round_counts):
+            teams_round_counts[team] += counts
+        for bracket, points_dict in brackets:
+            print("Winner: " + win_check)
+            print("Elite 8: " + str(bracket[0]))
+            print("Final 4: " + str(bracket[1]))
+            print("Championship: " + str(bracket[2]))
+            print("Champion: " + str(bracket[3]))
             print(str(points_dict) + "\n")
-        if advanced == True and win_check == winner:
-            for curteam in teams_list:
-                if curteam in elite_eight:
-                    teams_round_counts[curteam][0] += 1
-                if curteam in final_four:
-                    teams_round_counts[curteam][1] += 1
-                if curteam in championship:
-                    teams_round_counts[curteam][2] += 1
-                if curteam in champion:
-                    teams_round_counts[curteam][3] += 1
     if advanced == True:
         for team, counts in teams_round_counts.items():
-            temp_list = [0, 0, 0, 0]
-            counter = 0
-            for count in counts:
-                try:
-                    temp_list[counter] = round(count / win_count[win_check], 3)
-                    counter += 1
-                except ZeroDivisionError:
-                    continue
-            teams_round_counts[team] = temp_list
+            try:
+                teams_round_counts[team] = [
+                    round(count / win_count[win_check], 3) for count in counts.tolist()
+                ]
+            except ZeroDivisionError:
+                teams_round_counts[team] = [0, 0, 0, 0]
         print(
             "The percentage of times each team makes a certain round when "
             + win_check
@@ -391,6 +452,7 @@ def count_outcomes(
             print(team + ": " + str(counts))
         print("")
         
+    win_count, loss_count = dict(win_count), dict(loss_count)
     win_pcts, loss_pcts = get_win_loss_pcts(win_count, loss_count, iterations)
     
     return win_count, loss_count, win_pcts, loss_pcts
@@ -407,26 +469,25 @@ def results_to_csv(
 ):
     """Creates a csv with the win and loss counts by player for a run of the model"""
 
-    csv_lists = [
-        [
-            "These are the results of a model run with "
-            + str(iterations)
-            + " iterations using a "
-            + probability
-            + " probability model."
-        ],
-        ["player", "wins", "losses", "win pcts", "loss pcts"],
-    ]
-
-    for player, counts in win_count.items():
-        csv_line = []
-        csv_line.append(player)
-        csv_line.append(win_count[player])
-        csv_line.append(loss_count[player])
-        csv_line.append(win_pcts[player])
-        csv_line.append(loss_pcts[player])
-        csv_lists.append(csv_line)
-    with open(filename, "w", newline="") as csvfile:
+    with open(filename, "w", newline="", encoding="utf-8") as csvfile:
         writer = csv.writer(csvfile)
-        for line in csv_lists:
-            writer.writerow(line)
+        writer.writerow(
+            [
+                "These are the results of a model run with "
+                + str(iterations)
+                + " iterations using a "
+                + probability
+                + " probability model."
+            ]
+        )
+        writer.writerow(["player", "wins", "losses", "win pcts", "loss pcts"])
+        writer.writerows(
+            (
+                player,
+                win_count[player],
+                loss_count[player],
+                win_pcts[player],
+                loss_pcts[player],
+            )
+            for player in win_count
+        )